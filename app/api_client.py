@@ -1,129 +1,87 @@
+import logging
 import requests
 from typing import Dict, List, Optional, Any
 
+log = logging.getLogger(__name__)
+
 
 class APIClient:
     def __init__(self, base_url: str = "https://data-tracking-overview.onrender.com"):
         self.base_url = base_url
+        # Reuse one keep-alive connection pool instead of a new TLS handshake per call
+        self.session = requests.Session()
 
-    def get_events(
-        self, campaign_id: Optional[int] = None, employee_id: Optional[int] = None
-    ) -> List[Dict]:
-        """Get events, optionally filtered by campaign"""
+    def _request(self, method: str, path: str, error_message: str, **kwargs) -> Any:
+        """Send a request to the API and return the decoded JSON body"""
         try:
-            params = {}
-            if campaign_id:
-                params["campaign_id"] = campaign_id
-            # if employee_id:
-            # params["employee_id"] = employee_id
-            response = requests.get(f"{self.base_url}/events", params=params)
+            response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching events: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
+            log.exception(
+                "%s, response content: %s",
+                error_message,
+                e.response.content if e.response is not None else "No response content",
             )
             raise
 
+    def get_events(
+        self, campaign_id: Optional[int] = None, employee_id: Optional[int] = None
+    ) -> List[Dict]:
+        """Get events, optionally filtered by campaign"""
+        params = {}
+        if campaign_id:
+            params["campaign_id"] = campaign_id
+        # if employee_id:
+        # params["employee_id"] = employee_id
+        return self._request("GET", "/events", "Error fetching events", params=params)
+
     def create_campaign(
         self, name: str, target_count: int, description: str = ""
     ) -> Dict:
         """Create a new campaign"""
-        try:
-            data = {
-                "name": name,
-                "target_count": target_count,
-                "description": description,
-            }
-            response = requests.post(f"{self.base_url}/campaigns", json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error creating campaign: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
-            )
-            raise
+        data = {
+            "name": name,
+            "target_count": target_count,
+            "description": description,
+        }
+        return self._request("POST", "/campaigns", "Error creating campaign", json=data)
 
     def get_campaigns(self) -> List[Dict]:
         """Get all campaigns"""
-        try:
-            response = requests.get(f"{self.base_url}/campaigns")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching campaigns: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
-            )
-            raise
+        return self._request("GET", "/campaigns", "Error fetching campaigns")
 
     def get_campaign(self, campaign_id: int) -> Dict:
         """Get a specific campaign details"""
-        try:
-            response = requests.get(f"{self.base_url}/campaigns/{campaign_id}")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching campaign: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
-            )
-            raise
+        return self._request(
+            "GET", f"/campaigns/{campaign_id}", "Error fetching campaign"
+        )
 
     def update_campaign_status(self, campaign_id: int, status: str) -> Dict:
         """Update campaign status"""
-        try:
-            response = requests.patch(
-                f"{self.base_url}/campaigns/{campaign_id}/status",
-                json={"status": status},
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error updating campaign status: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
-            )
-            raise
+        return self._request(
+            "PATCH",
+            f"/campaigns/{campaign_id}/status",
+            "Error updating campaign status",
+            json={"status": status},
+        )
 
     def add_employee(self, employee_data: Dict[str, Any]) -> Dict:
         """
         Add an employee to database
         """
-        try:
-            if not employee_data.get("email"):
-                raise ValueError("Email is required")
-            # Debug print of request data
-            print(f"Sending employee data: {employee_data}")
+        if not employee_data.get("email"):
+            raise ValueError("Email is required")
+        log.debug("Sending employee data: %s", employee_data)
 
-            response = requests.post(f"{self.base_url}/employees", json=employee_data)
-            # Print detailed error response
-            if not response.ok:
-                print(f"Response status: {response.status_code}")
-                print(f"Response headers: {response.headers}")
-                print(f"Response text: {response.text}")
-
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error adding employee: {str(e)}")
-            print(f"Request body: {employee_data}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
+        try:
+            return self._request(
+                "POST", "/employees", "Error adding employee", json=employee_data
             )
+        except requests.exceptions.RequestException:
+            log.error("Request body: %s", employee_data)
             raise
 
     def get_employees(self) -> List[Dict]:
         """Get all employees"""
-        try:
-            response = requests.get(f"{self.base_url}/employees")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching employees: {str(e)}")
-            print(
-                f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}"
-            )
-            raise
+        return self._request("GET", "/employees", "Error fetching employees")
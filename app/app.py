@@ -3,10 +3,17 @@ import streamlit as st
 st.set_page_config(layout="wide", page_title="Phish&Clicks", page_icon=":fish:")
 
 st.logo("app/phish_clicks_logo/png/phish-n-clicks-logo-hori-purple.png", size="large")
+
+
+@st.cache_resource
+def load_style() -> str:
+    """Read the CSS once per process instead of on every rerun."""
+    with open("app/style.css") as style_file:
+        return "<style>" + style_file.read() + "</style>"
+
+
 # Loading CSS style
-st.markdown(
-    "<style>" + open("app/style.css").read() + "</style>", unsafe_allow_html=True
-)
+st.markdown(load_style(), unsafe_allow_html=True)
 
 # Initialize authentication state
 if "authenticated" not in st.session_state:
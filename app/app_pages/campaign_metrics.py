@@ -10,10 +10,21 @@ root_dir = Path(__file__).parent.parent
 sys.path.append(str(root_dir))
 from api_client import APIClient
 
+# Event type values as stored by the tracking API
+EVENT_TYPES = (
+    "open",
+    "click",
+    "submitted",
+    "downloaded_attachement",
+    "reported",
+)
 
+
+@st.cache_data(ttl=60)
 def dataframe_creation() -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Fetches events and campaigns data from an external API and creates corresponding DataFrames.
+    Results are cached for 60 seconds so widget interactions do not refetch the API.
     Returns:
         tuple[pd.DataFrame, pd.DataFrame]: Two DataFrames - events and campaigns data.
     """
@@ -38,18 +49,11 @@ def create_final_dataframe(
     Returns:
         pd.DataFrame: merged dataFrame with event counts per campaign.
     """
-    all_event_types = [
-        "open",
-        "click",
-        "submitted",
-        "downloaded_attachement",
-        "reported",
-    ]
     event_counts = (
         events_df.groupby(["campaign_id", "event_type"]).size().unstack(fill_value=0)
     )
     # Ensure all event types are represented
-    for event in all_event_types:
+    for event in EVENT_TYPES:
         if event not in event_counts.columns:
             event_counts[event] = 0
     # Merge campaigns with event counts
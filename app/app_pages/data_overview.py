@@ -6,9 +6,10 @@ from api_client import APIClient
 root_dir = Path(__file__).parent.parent.parent
 sys.path.append(str(root_dir))
 
-# Fetch data from external endpoint
+# Fetch data from external endpoint, cached briefly so widget reruns reuse it
 
 
+@st.cache_data(ttl=60)
 def fetch_data():
     api_client = APIClient()
     tracking_data = api_client.get_events()
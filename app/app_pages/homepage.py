@@ -218,6 +218,9 @@ def campaign_launch_form():
                                     api_client.add_employee(employee_data)
                                     employees_added_count += 1
 
+                            # Campaigns and employees changed, drop cached API data
+                            st.cache_data.clear()
+
                             # Display the number of employees added
                             st.success(
                                 f"Count of new employees: {employees_added_count}"
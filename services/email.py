@@ -1,4 +1,5 @@
 import base64
+import logging
 import os.path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -11,6 +12,8 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from services.generate import Generator
 
+log = logging.getLogger(__name__)
+
 
 class Emailer:
     def __init__(
@@ -29,9 +32,22 @@ class Emailer:
         self.token_path = token_path
         self.creds = None
         self.service = None
+        self.attachment_path = "attachments/training.pdf"
+        self.attachment_data = self.load_attachment()
 
         self.authenticate()
 
+    def load_attachment(self):
+        """
+        Read the training attachment once so it is reused for every message.
+
+        :return: The raw bytes of the attachment, or None if the file is missing.
+        """
+        if not os.path.exists(self.attachment_path):
+            return None
+        with open(self.attachment_path, "rb") as attachment_file:
+            return attachment_file.read()
+
     def authenticate(self):
         """Authenticate the user and initialize the Gmail API service."""
         if os.path.exists(self.token_path):
@@ -83,15 +99,13 @@ class Emailer:
         message.attach(alternative_part)
 
         # Attach a file if provided
-        attachment_path = "attachments/training.pdf"
-        if os.path.exists(attachment_path):
-            file_name = os.path.basename(attachment_path)
+        if self.attachment_data is not None:
+            file_name = os.path.basename(self.attachment_path)
             main_type, sub_type = "application", "pdf"
 
-            with open(attachment_path, "rb") as attachment_file:
-                # Create a MIMEBase object and set the payload
-                part = MIMEBase(main_type, sub_type)
-                part.set_payload(attachment_file.read())
+            # Create a MIMEBase object and set the payload
+            part = MIMEBase(main_type, sub_type)
+            part.set_payload(self.attachment_data)
 
             # Encode the payload in base64
             encoders.encode_base64(part)
@@ -137,6 +151,6 @@ class Emailer:
             )
             print(f"Message sent! Message ID: {sent_message['id']}")
             return sent_message
-        except HttpError as error:
-            print(f"An error occurred: {error}")
+        except HttpError:
+            log.exception("Failed to send message")
             return None